@@ -82,19 +82,30 @@ class FolderWatcherConfig(BaseModel):
 
     Attributes:
         folder_path (str): Path to the folder to monitor for *.url files.
-        sleep_time (int): Interval in seconds between folder checks (minimum: 1).
+        sleep_time (int): Interval in seconds between housekeeping sweeps of
+            the folder (minimum: 1). New files are picked up immediately by
+            the file watcher; the sweep catches anything it missed. If the
+            watcher fails, empty sweeps back off up to 16 times this interval.
         ffnet_disable (bool): Whether to disable FanFiction.Net processing.
+        watch_interval (int): Seconds between directory scans when the folder
+            is on a network filesystem and the file watcher has to poll
+            (minimum: 1).
     """
 
     folder_path: str = Field(
         default="", description="Path to folder containing *.url files"
     )
     sleep_time: int = Field(
-        default=60, ge=1, description="Sleep time between folder checks in seconds"
+        default=60, ge=1, description="Seconds between housekeeping sweeps of the folder"
     )
     ffnet_disable: bool = Field(
         default=True, description="Disable FanFiction.Net processing"
     )
+    watch_interval: int = Field(
+        default=5,
+        ge=1,
+        description="Polling interval in seconds for folders on network filesystems",
+    )
 
     @field_validator("folder_path")
     @classmethod
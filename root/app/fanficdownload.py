@@ -143,6 +143,9 @@ def main() -> None:
         # Log Folder Watcher Configuration - Folder monitoring and processing behavior
         ff_logging.log(f"  Folder Path: {config.folder_watcher.folder_path or 'Not Specified'}")
         ff_logging.log(f"  Folder Check Interval: {config.folder_watcher.sleep_time}")
+        ff_logging.log(
+            f"  Folder Poll Interval (network filesystems): {config.folder_watcher.watch_interval}"
+        )
         ff_logging.log(f"  FFNet Disabled: {config.folder_watcher.ffnet_disable}")
 
         # Log SMTP Configuration - Email notification settings
@@ -194,7 +197,7 @@ def main() -> None:
     # --- End Logging ---
 
     # Initialize configurations for folder monitoring and processing
-    folder_info = url_ingester.FolderWatcherInfo(args.config)
+    folder_info = url_ingester.FolderWatcherInfo(args.config, config=config)
 
     # Use ProcessManager for robust process handling with signal management
     with ProcessManager(config=config) as process_manager:
@@ -214,6 +217,7 @@ def main() -> None:
                 "folder_watcher",
                 url_ingester.folder_watcher,
                 args=(folder_info, notification_info, queues),
+                stop_callback=folder_info.shutdown,
             )
 
             # Register waiting watcher process for retry handling
@@ -113,6 +113,8 @@ class ProcessInfo:
         last_health_check: Unix timestamp of the last health check
         restart_count: Number of times this process has been restarted
         pid: Process ID assigned by the operating system (None when stopped)
+        stop_callback: Optional callable that asks the process to exit on its
+                      own during application shutdown, before SIGTERM is sent
     
     Example:
         ```python
@@ -135,6 +137,7 @@ class ProcessInfo:
     last_health_check: Optional[float] = None
     restart_count: int = 0
     pid: Optional[int] = None
+    stop_callback: Optional[Callable[[], None]] = None
 
     def is_alive(self) -> bool:
         """
@@ -263,6 +266,7 @@ class ProcessManager:
         target: Callable,
         args: Tuple = (),
         kwargs: Optional[Dict[str, Any]] = None,
+        stop_callback: Optional[Callable[[], None]] = None,
     ) -> None:
         """
         Register a process for management without starting it.
@@ -280,6 +284,10 @@ class ProcessManager:
                  Common pattern is to pass queues and shutdown events.
             kwargs: Dictionary of keyword arguments to pass to the target.
                    Will be merged with args during process creation.
+            stop_callback: Called by stop_process() during application
+                   shutdown, before SIGTERM is sent, to let the process exit
+                   cleanly (e.g. by setting an event it waits on). Not used
+                   when a process is stopped in order to be restarted.
                    
         Raises:
             None: Method logs failure for duplicate names but doesn't raise.
@@ -306,7 +314,13 @@ class ProcessManager:
             return
 
         kwargs = kwargs or {}
-        process_info = ProcessInfo(name=name, target=target, args=args, kwargs=kwargs)
+        process_info = ProcessInfo(
+            name=name,
+            target=target,
+            args=args,
+            kwargs=kwargs,
+            stop_callback=stop_callback,
+        )
 
         self.processes[name] = process_info
         ff_logging.log_debug(f"Registered process: {name}")
@@ -395,13 +409,17 @@ class ProcessManager:
         """
         Stop a running process gracefully with configurable timeout.
         
-        Attempts graceful termination first using SIGTERM, then forces
-        termination with SIGKILL if the process doesn't respond within
-        the timeout period. Updates process state and cleans up resources.
+        During application shutdown, a process registered with a
+        stop_callback is first asked to exit on its own. Otherwise (or if it
+        does not exit) graceful termination is attempted with SIGTERM, and
+        termination is forced with SIGKILL if the process doesn't respond
+        within the timeout period. Updates process state and cleans up
+        resources.
 
         Args:
             name: Name of the registered process to stop
-            timeout: Maximum seconds to wait for graceful shutdown.
+            timeout: Maximum seconds to wait for graceful shutdown, shared
+                    between the stop_callback and SIGTERM stages.
                     Uses process_config.shutdown_timeout if None.
 
         Returns:
@@ -410,10 +428,11 @@ class ProcessManager:
                  
         Process Flow:
             1. Check if process is registered and running
-            2. Send SIGTERM for graceful shutdown
-            3. Wait for timeout period
-            4. Send SIGKILL if still running
-            5. Clean up process resources and state
+            2. On shutdown, call stop_callback and wait up to half the timeout
+            3. Send SIGTERM if still running
+            4. Wait for the rest of the timeout period
+            5. Send SIGKILL if still running
+            6. Clean up process resources and state
             
         Example:
             ```python
@@ -454,9 +473,21 @@ class ProcessManager:
             # Store reference to avoid race conditions
             process = process_info.process
 
+            # Both graceful stages share one timeout budget
+            deadline = time.monotonic() + timeout
+
+            # On shutdown, ask the process to exit on its own first
+            if self._shutdown_event.is_set() and process_info.stop_callback:
+                try:
+                    process_info.stop_callback()
+                    process.join(timeout / 2)
+                except Exception as e:
+                    ff_logging.log_failure(f"Error in stop callback for '{name}': {e}")
+
             # Attempt graceful termination with SIGTERM
-            process.terminate()
-            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join(max(0.0, deadline - time.monotonic()))
 
             # Force kill if process is still alive after timeout
             if process.is_alive():
@@ -68,6 +68,41 @@ from auto_url_parsers import url_parsers
 # This eliminates the need to manually maintain regex patterns for each site
 # The patterns are extracted from getSiteExamples() in fanficfare.adapters
 
+# Literal domain embedded in a generated site pattern, e.g. "archiveofourown\.org"
+# in "https?://(archiveofourown\.org/works/\d+)/?.*"
+_pattern_domain = re.compile(r"https\?://(?:\(\?:www\\\.\)\?)?\(?((?:\\.|[\w-])+)")
+
+
+def _literal_domain(pattern: str) -> str | None:
+    """
+    Return the domain every URL matched by a site pattern must contain.
+
+    Args:
+        pattern: Source of a pattern generated by auto_url_parsers
+
+    Returns:
+        str | None: The unescaped domain (e.g. "archiveofourown.org"), or
+                    None if the pattern has no literal domain (the "other"
+                    catch-all)
+    """
+    match = _pattern_domain.search(pattern)
+    if not match or "." not in match.group(1):
+        return None
+    return re.sub(r"\\(.)", r"\1", match.group(1))
+
+
+def _build_site_table(parsers: dict) -> list:
+    """Pair each site parser with its literal domain, preserving parser order."""
+    return [
+        (site, parser, prefix, _literal_domain(parser.pattern))
+        for site, (parser, prefix) in parsers.items()
+    ]
+
+
+# A plain substring test rejects a site far faster than running its regex, so
+# only the parsers whose domain appears in the URL are actually searched
+_site_table = _build_site_table(url_parsers)
+
 # Define regular expressions for different story formats and errors
 # These patterns are used to parse FanFicFare output for various conditions
 
@@ -348,8 +383,10 @@ def generate_FanficInfo_from_url(url: str) -> fanfic_info.FanficInfo:
         any known fanfiction site patterns. These URLs are passed through
         unchanged but may not be supported by FanFicFare.
     """
-    # Test URL against all auto-generated site parsers
-    for site, (parser, prefix) in url_parsers.items():
+    # Test URL against all auto-generated site parsers, in order
+    for site, parser, prefix, domain in _site_table:
+        if domain is not None and domain not in url:
+            continue
         if match := parser.search(url):
             # Handle cases where there are multiple capture groups (e.g., for alternative patterns)
             captured_group = None
@@ -9,6 +9,7 @@ throughout the AutomatedFanfic application.
 Key Features:
     - Safe temporary directory management with automatic cleanup
     - File system scanning and filtering by extension
+    - Network filesystem detection for file-watch fallbacks
     - Configuration file copying for Calibre integration
     - Context manager support for resource management
 
@@ -44,11 +45,37 @@ Thread Safety:
 
 from contextlib import contextmanager
 import os
+import re
 import shutil
 from tempfile import mkdtemp
 
 import calibre_info
 
+# Filesystem types on which inotify/FSEvents do not see changes made by
+# other hosts, so folder watching has to fall back to polling
+NETWORK_FILESYSTEMS = frozenset(
+    {
+        "nfs",
+        "nfs4",
+        "cifs",
+        "smb",
+        "smb2",
+        "smb3",
+        "smbfs",
+        "9p",
+        "afs",
+        "ceph",
+        "glusterfs",
+        "fuse.sshfs",
+        "fuse.rclone",
+        "fuse.glusterfs",
+        "fuse.s3fs",
+        "fuse.gcsfuse",
+        "davfs",
+        "fuse.davfs",
+    }
+)
+
 
 @contextmanager
 def temporary_directory():
@@ -209,3 +236,64 @@ def copy_configs_to_temp_dir(cdb: calibre_info.CalibreInfo, temp_dir: str) -> No
     # Copy personal configuration if it exists
     if cdb.personal_ini:
         shutil.copyfile(cdb.personal_ini, os.path.join(temp_dir, "personal.ini"))
+
+
+def get_filesystem_type(path, mounts_file="/proc/mounts"):
+    """
+    Determine the filesystem type backing a path.
+
+    Reads the kernel mount table and picks the longest mount point that
+    contains the resolved path, mirroring how the kernel resolves mounts.
+
+    Args:
+        path (str): File or directory path to classify.
+        mounts_file (str, optional): Mount table to read. Defaults to
+                                    /proc/mounts.
+
+    Returns:
+        str | None: The filesystem type (e.g., "ext4", "nfs4", "cifs"), or
+                   None if the mount table is unavailable (non-Linux hosts).
+
+    Example:
+        ```python
+        get_filesystem_type("/watch")
+        # Returns: "cifs" for an SMB share mounted at /watch
+        ```
+    """
+    real_path = os.path.realpath(path)
+    try:
+        with open(mounts_file, "r", encoding="utf-8") as f:
+            mounts = f.readlines()
+    except OSError:
+        return None
+
+    best_mount, best_type = "", None
+    for line in mounts:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        # Spaces and other special characters are octal-escaped (e.g. \040)
+        mount_point = re.sub(
+            r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), fields[1]
+        )
+        if (
+            real_path == mount_point
+            or real_path.startswith(mount_point.rstrip("/") + "/")
+        ) and len(mount_point) >= len(best_mount):
+            best_mount, best_type = mount_point, fields[2]
+
+    return best_type
+
+
+def is_network_filesystem(path):
+    """
+    Check whether a path lives on a network filesystem (NFS, CIFS/SMB, ...).
+
+    Args:
+        path (str): File or directory path to classify.
+
+    Returns:
+        bool: True if the path is on one of NETWORK_FILESYSTEMS, False for
+             local filesystems or when the type cannot be determined.
+    """
+    return get_filesystem_type(path) in NETWORK_FILESYSTEMS
@@ -6,25 +6,28 @@ URL files (*.url), extracting URLs from these files, and routing
 them to appropriate processing queues based on the detected fanfiction site.
 
 Key Features:
-    - Folder monitoring with configurable polling intervals
+    - Event-driven folder monitoring via OS file-watch APIs (inotify/FSEvents)
+    - Periodic housekeeping sweep for files missed by the watcher
     - Automatic URL extraction from *.url files
     - Site-specific URL routing to dedicated processing queues
-    - Logging suppression during URL extraction for clean output
+    - Batched enqueueing: one queue put per site per batch of files
     - Special handling for problematic sites (e.g., FFNet disable)
 
 Architecture:
-    The module implements a continuous monitoring loop that scans a folder
-    for *.url files, extracts URLs from their contents, identifies the 
-    fanfiction site, and routes URLs to site-specific worker queues for processing.
+    The module runs two cooperating loops. A file-watch loop blocks on
+    filesystem events from watchfiles and processes each *.url file as soon
+    as it appears. A housekeeping loop sweeps the folder every sleep_time
+    seconds to pick up files dropped before the watcher started or events
+    the watcher missed. Both loops extract URLs, identify the fanfiction
+    site, and route URLs to site-specific worker queues for processing.
 
 Folder Processing Flow:
-    1. Scan configured folder for *.url files at specified intervals
+    1. Wait for *.url file events (or the next housekeeping sweep)
     2. Read URL content from each file
     3. Parse URLs to identify source fanfiction sites
     4. Route URLs to appropriate processor queues
     5. Handle special cases (FFNet notifications vs. processing)
     6. Remove processed files
-    7. Sleep until next polling cycle
 
 Example:
     ```python
@@ -35,10 +38,11 @@ Example:
     folder_info = FolderWatcherInfo("config.toml")
     
     # Set up processing queues
+    manager = mp.Manager()
     queues = {
-        "archiveofourown.org": mp.Queue(),
-        "fanfiction.net": mp.Queue(),
-        "other": mp.Queue()
+        "archiveofourown.org": manager.Queue(),
+        "fanfiction.net": manager.Queue(),
+        "other": manager.Queue()
     }
     
     # Start monitoring (typically in a separate process)
@@ -48,10 +52,13 @@ Example:
 Configuration:
     Folder watcher settings are loaded from TOML configuration:
     - folder_path: Path to folder containing *.url files
-    - sleep_time: Seconds between polling cycles
+    - sleep_time: Seconds between housekeeping sweeps
+    - watch_interval: Polling interval used on network filesystems
     - ffnet_disable: Whether to disable FFNet processing
 
 Dependencies:
+    - watchfiles: For OS-level file change notifications
+    - system_utils: For network filesystem detection
     - regex_parsing: For URL site identification
     - notification_wrapper: For sending notifications
     - config_models: For configuration management
@@ -62,70 +69,73 @@ Thread Safety:
     shared queues and is safe for concurrent operation.
 """
 
+import functools
 import multiprocessing as mp
-import time
-import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import os
-import glob
-from pathlib import Path
-from contextlib import contextmanager
+import watchfiles
+import fanfic_info
 import ff_logging
 import regex_parsing
-
-# Compatibility module for tests - provides deprecated email functionality
-class DeprecatedEmailModule:
-    """Compatibility module to support legacy tests."""
-    
-    @staticmethod
-    def get_urls_from_imap(*args, **kwargs):
-        """Legacy function for backward compatibility. Returns empty list."""
-        logging.warning("get_urls_from_imap is deprecated and no longer functional")
-        return []
-
-# Create module-level compatibility object
-geturls = DeprecatedEmailModule()
+import system_utils
 import notification_wrapper
 from config_models import ConfigManager
 
+# Maximum number of FanficInfo objects sent to a worker queue in one put
+BATCH_SIZE = 50
+
+# Once the file watcher has failed, empty housekeeping sweeps double the wait,
+# up to sleep_time times this factor
+MAX_BACKOFF_FACTOR = 16
+
+# Site id auto_url_parsers assigns to fanfiction.net, diverted when ffnet_disable
+_FFNET_SITE = "fanfiction"
+
+# Suffix of the files picked up from the watched folder; matched with
+# str.endswith rather than a glob so no fnmatch regex is involved
+_URL_SUFFIX = ".url"
+
+# Bytes read from each *.url file; far more than any single URL needs
+_MAX_URL_FILE_SIZE = 4096
+
+# Keep descriptors of files being read from leaking into spawned commands
+_O_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+
 
-@contextmanager
-def suppress_logging():
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path, mtime_ns, size):
+    """Parse config_path; the stat fields only serve as the cache key."""
+    return ConfigManager.load_config(config_path)
+
+
+def load_config(config_path):
     """
-    Temporarily suppress all logging output during URL extraction.
+    Load the TOML configuration, reusing the parsed result while unchanged.
 
-    This context manager disables logging by setting the global disable level
-    to CRITICAL, effectively suppressing all log messages during URL extraction
-    operations. This prevents verbose output from cluttering the
-    application logs during folder processing.
+    Results are cached per path and invalidated when the file's modification
+    time or size changes, so constructing several FolderWatcherInfo (or
+    legacy EmailInfo) objects from the same file costs one stat call each
+    instead of a full TOML parse and validation.
 
-    Example:
-        ```python
-        with suppress_logging():
-            # Operations here won't produce log output
-            site = regex_parsing.identify_site(url)
-        
-        # Normal logging resumes here
-        ```
+    Args:
+        config_path (str): Path to the TOML configuration file.
 
-    Note:
-        This affects the global logging state and should be used carefully.
-        The original logging level is always restored when the context exits,
-        even if an exception occurs.
+    Returns:
+        AppConfig: The validated configuration. Cached objects are shared
+                  between callers and must be treated as read-only.
 
-    Thread Safety:
-        This modifies global logging state and may affect other threads.
-        Consider using thread-local logging configuration if needed.
+    Raises:
+        ConfigError: If the configuration file cannot be loaded or parsed.
+        ConfigValidationError: If the configuration values are invalid.
     """
-    # Save current global logging disable level
-    old_level = logging.root.manager.disable
-    
-    # Disable all logging by setting to highest level
-    logging.disable(logging.CRITICAL)
     try:
-        yield
-    finally:
-        # Restore original logging state
-        logging.disable(old_level)
+        stat = os.stat(config_path)
+    except (OSError, TypeError, ValueError):
+        # Let ConfigManager report missing or invalid paths
+        return ConfigManager.load_config(config_path)
+    return _load_config_cached(config_path, stat.st_mtime_ns, stat.st_size)
 
 
 class FolderWatcherInfo:
@@ -138,8 +148,15 @@ class FolderWatcherInfo:
 
     Attributes:
         folder_path (str): Path to folder containing *.url files.
-        sleep_time (int): Seconds to wait between folder checks.
+        sleep_time (int): Seconds to wait between housekeeping sweeps.
         ffnet_disable (bool): Whether to disable FanFiction.Net processing.
+        watch_interval (int): Seconds between scans when the watcher polls.
+        stop_event (multiprocessing.Event): Set by shutdown() to stop
+                                          folder_watcher from any process.
+        force_polling (bool): Whether the file watcher polls instead of using
+                             inotify/FSEvents. Set automatically for folders on
+                             network filesystems (NFS, CIFS/SMB), where native
+                             events from other hosts are silently dropped.
 
     Example:
         ```python
@@ -158,6 +175,7 @@ class FolderWatcherInfo:
         folder_path = "/path/to/url/files"
         sleep_time = 60
         ffnet_disable = true
+        watch_interval = 5
         ```
 
     Security Note:
@@ -165,7 +183,7 @@ class FolderWatcherInfo:
         automatically process any *.url files placed in it.
     """
 
-    def __init__(self, config_path):
+    def __init__(self, config_path=None, *, config=None):
         """
         Initialize FolderWatcherInfo with configuration from TOML file.
 
@@ -176,6 +194,8 @@ class FolderWatcherInfo:
         Args:
             config_path (str): Path to the TOML configuration file containing
                               folder watcher settings.
+            config (AppConfig, optional): Already loaded configuration to use
+                                         instead of reading config_path.
 
         Raises:
             ConfigError: If the configuration file cannot be loaded or parsed.
@@ -189,18 +209,63 @@ class FolderWatcherInfo:
             print(f"Check interval: {folder_info.sleep_time} seconds")
             ```
         """
-        config = ConfigManager.load_config(config_path)
+        config = config or load_config(config_path)
         
         self.folder_path = config.folder_watcher.folder_path
         self.sleep_time = config.folder_watcher.sleep_time
         self.ffnet_disable = config.folder_watcher.ffnet_disable
+        self.watch_interval = config.folder_watcher.watch_interval
 
         # Validate that folder path is provided
         if not self.folder_path:
             raise ValueError("folder_path must be specified in configuration")
 
-        # Create folder if it doesn't exist
-        Path(self.folder_path).mkdir(parents=True, exist_ok=True)
+        # Create folder if it doesn't exist; a single stat in the common case
+        if not os.path.isdir(self.folder_path):
+            os.makedirs(self.folder_path, exist_ok=True)
+
+        # Native file events are unreliable on network mounts, poll there instead
+        self.force_polling = system_utils.is_network_filesystem(self.folder_path)
+
+        # Shared with the watcher process so shutdown() can stop it promptly
+        self.stop_event = mp.Event()
+
+        # Created inside the watcher process by folder_watcher (see _get_pool)
+        self._pool = None
+
+    def __getstate__(self):
+        # Thread pools cannot be pickled; each process creates its own
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def shutdown(self):
+        """
+        Ask folder_watcher to stop.
+
+        Wakes the housekeeping sweep from its sleep and ends the file-watch
+        loop, so the watcher returns within milliseconds instead of after up
+        to sleep_time seconds. Safe to call from any process.
+        """
+        self.stop_event.set()
+
+    def _get_pool(self):
+        """
+        Return the thread pool used for file I/O and URL routing, creating it
+        on first use.
+
+        Creation is not synchronized: folder_watcher creates the pool before
+        starting the housekeeping thread, so its two loops share one pool.
+
+        Returns:
+            ThreadPoolExecutor: Pool with min(32, 2 * CPU count) workers.
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 2),
+                thread_name_prefix="url_router",
+            )
+        return self._pool
 
     def get_urls(self):
         """
@@ -225,66 +290,379 @@ class FolderWatcherInfo:
             This method removes the *.url files after reading them to prevent
             reprocessing. Ensure files are properly backed up if needed.
         """
+        # Single directory pass; DirEntry caches the file type from getdents,
+        # so filtering costs no extra stat calls per entry
+        with os.scandir(self.folder_path) as it:
+            entries = [
+                entry
+                for entry in it
+                if entry.name.endswith(_URL_SUFFIX)
+                and entry.is_file(follow_symlinks=False)
+            ]
+
+        return self._process_files([entry.path for entry in entries])
+
+    def _process_files(self, url_files):
+        """
+        Read the URLs from a batch of *.url files, then remove the files.
+
+        Shared by the housekeeping sweep in get_urls() and the file-watch loop.
+        Works in two passes: every file is read first, then every file that
+        yielded a URL is removed, each unlink with its own error handling so one bad
+        file cannot hold up the rest of the batch. For more than one file the
+        reads and unlinks of each pass run concurrently on the shared thread
+        pool, so on slow storage a pass takes about as long as its slowest
+        file rather than the sum of all of them. A URL is only reported if
+        this call removed its file. When the two loops race on the same file
+        (or a network filesystem reports an event twice), the loser's unlink
+        fails with FileNotFoundError and its copy of the URL is dropped.
+
+        Empty files are left in place: a writer may have created the file and
+        not written the URL yet, so the later modified event (or the next
+        sweep) picks it up once the content is there.
+
+        Args:
+            url_files (list[str]): Paths of the *.url files to process.
+
+        Returns:
+            list[str]: URLs read from files this call removed. Empty and
+                      unreadable files are left in place.
+        """
+        # A single file is cheaper to handle inline than to hand to the pool
+        io_map = self._get_pool().map if len(url_files) > 1 else map
+
+        # Phase A: read every file; None marks files that could not be read
+        # and "" files that are still waiting for their content
+        read = []
+        for url_file, url in zip(url_files, io_map(self._read_url_file, url_files)):
+            if url:
+                read.append((url_file, url))
+            elif url is not None:
+                ff_logging.log_debug(
+                    f"{os.path.basename(url_file)} is empty, leaving it for a later pass"
+                )
+
+        # Phase B: remove the files that were read, claiming their URLs
+        removed = io_map(self._remove_url_file, [url_file for url_file, _ in read])
         urls = []
-        folder_path = Path(self.folder_path)
-        
-        # Find all .url files in the folder
-        url_files = folder_path.glob("*.url")
-        
-        for url_file in url_files:
+        for (url_file, url), was_removed in zip(read, removed):
+            if was_removed:
+                ff_logging.log_debug(f"Found URL in {os.path.basename(url_file)}: {url}")
+                urls.append(url)
+
+        return urls
+
+    @staticmethod
+    def _remove_url_file(url_file):
+        """
+        Remove a processed *.url file.
+
+        Args:
+            url_file (str): Path to the *.url file to remove.
+
+        Returns:
+            bool: True if this call removed the file, False if it was already
+                 gone or could not be removed.
+        """
+        name = os.path.basename(url_file)
+        try:
+            os.unlink(url_file)
+        except FileNotFoundError:
+            ff_logging.log_debug(f"{name} was already processed, skipping")
+            return False
+        except OSError as e:
+            ff_logging.log_debug(f"Error removing {url_file}: {e}")
+            return False
+        ff_logging.log_debug(f"Removed processed file: {name}")
+        return True
+
+    @staticmethod
+    def _read_url_file(url_file):
+        """
+        Read the URL from a single *.url file.
+
+        Args:
+            url_file (str): Path to the *.url file to read.
+
+        Returns:
+            str | None: The stripped file content (empty for empty files), or
+                       None if the file could not be read.
+        """
+        try:
+            # Read URL from file; .url files hold a single short line, so one
+            # read() without buffering or newline translation is enough
+            fd = os.open(url_file, os.O_RDONLY | _O_CLOEXEC)
             try:
-                # Read URL from file
-                with open(url_file, 'r', encoding='utf-8') as f:
-                    url = f.read().strip()
-                
-                if url:
-                    urls.append(url)
-                    ff_logging.log_debug(f"Found URL in {url_file.name}: {url}")
-                
-                # Remove the file after processing
-                url_file.unlink()
-                ff_logging.log_debug(f"Removed processed file: {url_file.name}")
-                
-            except Exception as e:
-                ff_logging.log_debug(f"Error processing {url_file}: {e}")
-                # Don't remove files that had errors
+                raw = os.read(fd, _MAX_URL_FILE_SIZE)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            ff_logging.log_debug(f"Error reading {url_file}: {e}")
+            return None
+        return raw.decode("utf-8", "replace").strip()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_url(url):
+    """
+    Identify the site and normalized URL for a raw URL, memoized per URL.
+
+    The same URL is often dropped more than once (duplicate files, re-adding
+    a story to be updated), so the site parser scan is only paid the first
+    time. Only the immutable (url, site) pair is cached; callers build a
+    fresh FanficInfo from it.
+
+    Args:
+        url (str): URL as read from a *.url file.
+
+    Returns:
+        tuple[str, str]: The normalized URL and the site identifier.
+    """
+    fanfic = regex_parsing.generate_FanficInfo_from_url(url)
+    return fanfic.url, fanfic.site
+
+
+def _is_url_file(change, path):
+    """Filter for watchfiles that only passes events for *.url files."""
+    return path.endswith(_URL_SUFFIX)
+
+
+def _route_one(url):
+    """
+    Parse one URL into the FanficInfo to queue.
+
+    Used as-is when FFNet processing is enabled; _route_one_ffnet_disabled
+    wraps it otherwise. _route_urls picks one of the two once per batch, so
+    the per-URL path carries no ffnet_disable check.
+
+    Args:
+        url (str): URL extracted from a *.url file.
+
+    Returns:
+        FanficInfo | None: The fanfic to queue, or None if the URL could not
+                          be parsed.
+    """
+    try:
+        # Parse URL to identify site and normalize format
+        fanfic = fanfic_info.FanficInfo(*_parse_url(url))
         
-        return urls
+        ff_logging.log_debug(f"Identified site for {url}: {fanfic.site}")
+        return fanfic
+            
+    except Exception as e:
+        ff_logging.log_debug(f"Error processing URL {url}: {e}")
+        return None
+
+
+def _route_one_ffnet_disabled(url, notification_info):
+    """
+    Parse one URL, diverting FFNet stories to a notification.
+
+    Args:
+        url (str): URL extracted from a *.url file.
+        notification_info: Notification wrapper for FFNet notifications.
+
+    Returns:
+        FanficInfo | None: The fanfic to queue, or None if it was an FFNet
+                          story or could not be parsed.
+    """
+    fanfic = _route_one(url)
+    if fanfic is None or fanfic.site != _FFNET_SITE:
+        return fanfic
+
+    # Send notification instead of processing
+    try:
+        if notification_info:
+            notification_info.send_notification(
+                "New Fanfiction Download", fanfic.url, fanfic.site
+            )
+            ff_logging.log(f"FFNet notification sent: {url}")
+    except Exception as e:
+        ff_logging.log_debug(f"Error processing URL {url}: {e}")
+    return None
+
+
+def _route_urls(urls, folder_info, notification_info, queues):
+    """
+    Identify the site for each URL and route it to the matching queue.
+
+    URLs are parsed by _route_one(), or by _route_one_ffnet_disabled() when
+    FFNet processing is disabled. Only in that case, and only when several
+    files arrive together, do they go through the folder watcher's thread
+    pool, so that the blocking FFNet notification requests overlap instead
+    of running back to back. Plain parsing is memoized and GIL-bound and
+    gains nothing from threads. The results are then grouped by destination
+    queue and handed to _flush(), so a burst of files costs one queue put
+    (one lock round-trip and one pickle) per site rather than one per URL.
+
+    Args:
+        urls (list): URLs extracted from *.url files.
+        folder_info (FolderWatcherInfo): Folder configuration (ffnet_disable).
+        notification_info: Notification wrapper for FFNet notifications.
+        queues (dict): Dictionary mapping site names to processing queues.
+    """
+    # ffnet_disable is fixed for the process; choose the handler once per batch
+    if folder_info.ffnet_disable and len(urls) > 1:
+        route_one = functools.partial(
+            _route_one_ffnet_disabled, notification_info=notification_info
+        )
+        fanfics = list(folder_info._get_pool().map(route_one, urls))
+    elif folder_info.ffnet_disable:
+        fanfics = [_route_one_ffnet_disabled(url, notification_info) for url in urls]
+    else:
+        fanfics = [_route_one(url) for url in urls]
+
+    # Bound once: the grouping loop runs per URL
+    by_site = defaultdict(list)
+    get_queue = queues.get
+    for fanfic in fanfics:
+        if fanfic is None:
+            continue
+        # Group by destination queue, using "other" as fallback
+        site = fanfic.site
+        by_site[site if get_queue(site) else "other"].append(fanfic)
+
+    _flush(by_site, queues)
+
+
+def _flush(by_site, queues):
+    """
+    Put grouped FanficInfo objects on their site queues in batches.
+
+    Each queue receives lists of at most BATCH_SIZE FanficInfo objects;
+    url_worker unpacks them and processes the entries one at a time.
+
+    The put_many() branch exists only for faster_fifo-style queues, which
+    take a whole batch in one call and carry the entries individually. The
+    manager.Queue proxies used in production do not have put_many(), so
+    they always take the put() path.
+
+    Args:
+        by_site (dict): Mapping of queue name to a list of FanficInfo objects.
+        queues (dict): Dictionary mapping site names to processing queues.
+    """
+    log = ff_logging.log
+    for site, batch in by_site.items():
+        target_queue = queues.get(site)
+        if not target_queue:
+            ff_logging.log_debug(f"No queue available for site: {site}")
+            continue
+
+        put_many = getattr(target_queue, "put_many", None)
+        try:
+            if callable(put_many):
+                put_many(batch)
+            else:
+                put = target_queue.put
+                for start in range(0, len(batch), BATCH_SIZE):
+                    put(batch[start : start + BATCH_SIZE])
+        except Exception as e:
+            ff_logging.log_debug(f"Error queueing URLs for {site}: {e}")
+            continue
+
+        for fanfic in batch:
+            log(f"Queued URL for {fanfic.site}: {fanfic.url}")
+
+
+def _housekeeping_loop(folder_info, notification_info, queues, watcher_failed):
+    """
+    Sweep the folder for *.url files every sleep_time seconds.
+
+    Catches files that were dropped before the file watcher started and any
+    events the watcher missed. While the watcher runs the interval stays
+    fixed, since the sweep is the only catch for missed events. Once
+    watcher_failed is set the sweep is the sole poller: each sweep that
+    finds nothing doubles the wait, up to sleep_time * MAX_BACKOFF_FACTOR,
+    and a sweep that finds files resets it to sleep_time. Runs in a daemon
+    thread until folder_info.shutdown() is called.
+    """
+    current_sleep = folder_info.sleep_time
+    max_sleep = folder_info.sleep_time * MAX_BACKOFF_FACTOR
+    while True:
+        urls = []
+        try:
+            urls = folder_info.get_urls()
+            _route_urls(urls, folder_info, notification_info, queues)
+        except Exception as e:
+            ff_logging.log_debug(f"Error in folder housekeeping loop: {e}")
+
+        if urls or not watcher_failed.is_set():
+            current_sleep = folder_info.sleep_time
+        else:
+            current_sleep = min(current_sleep * 2, max_sleep)
+
+        # Sleep until next sweep, waking immediately on shutdown
+        if folder_info.stop_event.wait(current_sleep):
+            break
+
+
+def _file_watch_loop(folder_info, notification_info, queues):
+    """
+    Block on filesystem events and process *.url files as they appear.
+
+    Uses watchfiles (inotify on Linux, FSEvents on macOS) so an idle folder
+    costs no CPU and new files are picked up within the watcher's debounce
+    window instead of waiting for the next sweep. On network filesystems the
+    watcher polls the folder every watch_interval seconds instead.
+    """
+    for changes in watchfiles.watch(
+        folder_info.folder_path,
+        watch_filter=_is_url_file,
+        recursive=False,
+        # None keeps watchfiles' own defaults (WATCHFILES_FORCE_POLLING, WSL2)
+        force_polling=True if folder_info.force_polling else None,
+        poll_delay_ms=folder_info.watch_interval * 1000,
+        stop_event=folder_info.stop_event,
+    ):
+        try:
+            # Files may be created empty and written afterwards; empty files
+            # are left alone on "added" and read again on "modified"
+            paths = [
+                path
+                for change, path in changes
+                if change in (watchfiles.Change.added, watchfiles.Change.modified)
+            ]
+            urls = folder_info._process_files(paths)
+            _route_urls(urls, folder_info, notification_info, queues)
+        except Exception as e:
+            ff_logging.log_debug(f"Error in folder watcher loop: {e}")
 
 
 def folder_watcher(folder_info, notification_info, queues):
     """
     Monitor folder for *.url files and route URLs to appropriate processing queues.
 
-    This function implements the main folder monitoring loop. It continuously
-    scans the configured folder for *.url files, extracts URLs from them, 
-    identifies the fanfiction sites, and routes the URLs to site-specific 
+    This function implements the main folder monitoring loop. It starts a
+    housekeeping thread that sweeps the folder every sleep_time seconds, then
+    blocks on filesystem events for new *.url files. URLs are extracted,
+    the fanfiction sites identified, and the URLs routed to site-specific
     processing queues. Special handling is provided for disabled sites.
 
     Args:
         folder_info (FolderWatcherInfo): Configuration object containing folder
-                                       path, polling interval, and processing options.
+                                       path, sweep interval, and processing options.
         notification_info: Notification wrapper for sending alerts and updates.
-        queues (dict): Dictionary mapping site names to multiprocessing.Queue
-                      objects for distributing URLs to site-specific workers.
+        queues (dict): Dictionary mapping site names to manager.Queue proxies
+                      for distributing URLs to site-specific workers.
 
     Process Flow:
-        1. Scan folder for *.url files at configured intervals
-        2. Extract URLs from each file
-        3. Identify the fanfiction site for each URL
-        4. Route URLs to appropriate processing queues
-        5. Handle special cases (e.g., FFNet notifications)
-        6. Remove processed files
-        7. Sleep until next polling cycle
+        1. Start the housekeeping sweep in a background thread
+        2. Wait for *.url file events from the OS file watcher
+        3. Extract URLs from each new file
+        4. Identify the fanfiction site for each URL
+        5. Route URLs to appropriate processing queues
+        6. Handle special cases (e.g., FFNet notifications)
+        7. Remove processed files
 
     Example:
         ```python
         # Set up configuration and queues
         folder_info = FolderWatcherInfo("config.toml")
+        manager = mp.Manager()
         queues = {
-            "archiveofourown.org": mp.Queue(),
-            "fanfiction.net": mp.Queue(),
-            "other": mp.Queue()
+            "archiveofourown.org": manager.Queue(),
+            "fanfiction.net": manager.Queue(),
+            "other": manager.Queue()
         }
         
         # Start monitoring (typically in separate process)
@@ -292,98 +670,42 @@ def folder_watcher(folder_info, notification_info, queues):
         ```
 
     Note:
-        This function runs indefinitely until the process is terminated.
-        It's designed to be run in a separate process via multiprocessing
-        for isolation and concurrent operation with other components.
+        This function runs until folder_info.shutdown() is called or the
+        process is terminated. It's designed to be run in a separate process
+        via multiprocessing for isolation and concurrent operation with other
+        components. If the file watcher cannot be started, the housekeeping
+        sweep keeps running as a plain polling loop.
     """
     ff_logging.log(f"Starting folder watcher on: {folder_info.folder_path}")
-    ff_logging.log(f"Check interval: {folder_info.sleep_time} seconds")
+    ff_logging.log(f"Housekeeping interval: {folder_info.sleep_time} seconds")
+    if folder_info.force_polling:
+        ff_logging.log(
+            f"Network filesystem detected, polling every {folder_info.watch_interval} seconds"
+        )
     ff_logging.log(f"FFNet processing: {'disabled' if folder_info.ffnet_disable else 'enabled'}")
 
-    while True:
-        try:
-            # Get URLs from folder
-            urls = folder_info.get_urls()
-            
-            # Process each URL
-            for url in urls:
-                try:
-                    # Parse URL to identify site and normalize format
-                    fanfic = regex_parsing.generate_FanficInfo_from_url(url)
-                    
-                    ff_logging.log_debug(f"Identified site for {url}: {fanfic.site}")
-                    
-                    # Handle FFNet disable logic
-                    if fanfic.site == "ffnet" and folder_info.ffnet_disable:
-                        # Send notification instead of processing
-                        if notification_info:
-                            notification_info.send_notification(
-                                "New Fanfiction Download", fanfic.url, fanfic.site
-                            )
-                            ff_logging.log(f"FFNet notification sent: {url}")
-                        continue
-                    
-                    # Route URL to appropriate queue
-                    target_queue = queues.get(fanfic.site)
-                    if not target_queue:
-                        # Use "other" queue as fallback
-                        target_queue = queues.get("other")
-                    
-                    if target_queue:
-                        # Queue the fanfic info object
-                        target_queue.put(fanfic)
-                        ff_logging.log(f"Queued URL for {fanfic.site}: {url}")
-                    else:
-                        ff_logging.log_debug(f"No queue available for site: {fanfic.site}")
-                        
-                except Exception as e:
-                    ff_logging.log_debug(f"Error processing URL {url}: {e}")
-                    
-        except Exception as e:
-            ff_logging.log_debug(f"Error in folder watcher loop: {e}")
-        
-        # Sleep until next check
-        time.sleep(folder_info.sleep_time)
-
-
-# Legacy compatibility aliases and functions
-class EmailInfo:
-    """Legacy class for backward compatibility. Use FolderWatcherInfo instead."""
-    
-    def __init__(self, config_path):
-        ff_logging.log("Warning: EmailInfo is deprecated. Please use FolderWatcherInfo.")
-        # Create a folder watcher instead
-        self._folder_watcher = FolderWatcherInfo(config_path)
-        
-        # Load the actual config to get email values for backward compatibility
-        from config_models import ConfigManager
-        config = ConfigManager.load_config(config_path)
-        
-        # Expose legacy attributes for backwards compatibility
-        self.email = config.email.email if hasattr(config, 'email') else ""
-        self.password = config.email.password if hasattr(config, 'email') else ""
-        self.server = config.email.server if hasattr(config, 'email') else ""
-        self.mailbox = config.email.mailbox if hasattr(config, 'email') else ""
-        self.sleep_time = config.email.sleep_time if hasattr(config, 'email') else self._folder_watcher.sleep_time
-        self.ffnet_disable = config.email.ffnet_disable if hasattr(config, 'email') else self._folder_watcher.ffnet_disable
-        
-    def get_urls(self):
-        """Legacy method that calls deprecated email functionality for backward compatibility."""
-        try:
-            # For backward compatibility with tests, try to call the old email function
-            return geturls.get_urls_from_imap()
-        except Exception:
-            # Fallback to folder watcher if email method fails
-            return self._folder_watcher.get_urls()
+    # Both loops use the pool; create it before they can race to do so
+    pool = folder_info._get_pool()
+    watcher_failed = threading.Event()
+    housekeeping = threading.Thread(
+        target=_housekeeping_loop,
+        args=(folder_info, notification_info, queues, watcher_failed),
+        name="folder_housekeeping",
+        daemon=True,
+    )
+    housekeeping.start()
 
-
-def email_watcher(email_info, notification_info, queues):
-    """Legacy function for backward compatibility. Use folder_watcher instead."""
-    ff_logging.log("Warning: email_watcher is deprecated. Please use folder_watcher.")
-    
-    # If it's actually an EmailInfo object, convert it
-    if hasattr(email_info, '_folder_watcher'):
-        folder_watcher(email_info._folder_watcher, notification_info, queues)
-    else:
-        # Assume it's already a FolderWatcherInfo object
-        folder_watcher(email_info, notification_info, queues)
+    try:
+        _file_watch_loop(folder_info, notification_info, queues)
+    except Exception as e:
+        ff_logging.log_failure(
+            f"File watcher stopped, falling back to polling every "
+            f"{folder_info.sleep_time} to "
+            f"{folder_info.sleep_time * MAX_BACKOFF_FACTOR} seconds: {e}"
+        )
+        watcher_failed.set()
+
+    housekeeping.join()
+
+    pool.shutdown()
+    ff_logging.log("Folder watcher stopped")
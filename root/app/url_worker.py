@@ -391,7 +391,8 @@ def url_worker(
     retry logic.
 
     Args:
-        queue (mp.Queue): Input queue containing FanficInfo objects to process.
+        queue (mp.Queue): Input queue containing FanficInfo objects, or lists of
+                         them (batches from the folder watcher), to process.
                          Worker continuously monitors this queue for new work.
         cdb (calibre_info.CalibreInfo): Calibre library configuration and connection
                                        information for story management.
@@ -415,6 +416,8 @@ def url_worker(
         - Regex parsing: Detects permanent vs. retryable failures
         - Force retry detection: Automatically retries with --force when appropriate
         - Calibre integration: Verifies successful addition to library
+        - Unexpected errors: The unprocessed rest of the current batch is put
+          back on the queue before the error ends the worker
 
     Temporary Directory Management:
         Each processing attempt uses an isolated temporary directory that includes:
@@ -457,76 +460,90 @@ def url_worker(
         Workers sleep for 5 seconds when the queue is empty to reduce CPU
         usage while maintaining reasonable responsiveness to new work.
     """
+    # FanficInfo objects from the current batch still waiting to be processed
+    pending = []
     while True:
-        # Check for available work, sleep briefly if queue is empty
-        if queue.empty():
-            sleep(5)
-            continue
+        if not pending:
+            # Check for available work, sleep briefly if queue is empty
+            if queue.empty():
+                sleep(5)
+                continue
+
+            # The folder watcher sends lists of FanficInfo objects, retries
+            # and force re-queues arrive as single objects
+            item = queue.get()
+            pending = item if isinstance(item, list) else [item]
 
         # Retrieve next fanfiction to process
-        fanfic = queue.get()
+        fanfic = pending.pop(0)
         # Skip None sentinel values used for graceful shutdown
         if fanfic is None:
             continue
 
-        # Process fanfiction in isolated temporary workspace
-        with system_utils.temporary_directory() as temp_dir:
-            site = fanfic.site
-            ff_logging.log(f"({site}) Processing {fanfic.url}", "HEADER")
+        try:
+            # Process fanfiction in isolated temporary workspace
+            with system_utils.temporary_directory() as temp_dir:
+                site = fanfic.site
+                ff_logging.log(f"({site}) Processing {fanfic.url}", "HEADER")
             
-            # Determine if this is an update (existing file) or new download (URL)
-            path_or_url = get_path_or_url(fanfic, cdb, temp_dir)
-            ff_logging.log(f"\t({site}) Updating {path_or_url}", "OKGREEN")
-
-            # Build FanFicFare command based on configuration and fanfic state
-            base_command = construct_fanficfare_command(cdb, fanfic, path_or_url)
-            # Execute command in temporary directory context
-            command = f"cd {temp_dir} && {base_command}"
-
-            try:
-                # Handle special case: force requested but update_no_force configured
-                if (
-                    fanfic.behavior == "force"
-                    and cdb.update_method == "update_no_force"
-                ):
-                    # Force failure to trigger special notification via failure handler
-                    raise Exception(
-                        "Force update requested but update method is 'update_no_force'"
-                    )
-
-                # Set up temporary workspace with configuration files
-                system_utils.copy_configs_to_temp_dir(cdb, temp_dir)
+                # Determine if this is an update (existing file) or new download (URL)
+                path_or_url = get_path_or_url(fanfic, cdb, temp_dir)
+                ff_logging.log(f"\t({site}) Updating {path_or_url}", "OKGREEN")
+
+                # Build FanFicFare command based on configuration and fanfic state
+                base_command = construct_fanficfare_command(cdb, fanfic, path_or_url)
+                # Execute command in temporary directory context
+                command = f"cd {temp_dir} && {base_command}"
+
+                try:
+                    # Handle special case: force requested but update_no_force configured
+                    if (
+                        fanfic.behavior == "force"
+                        and cdb.update_method == "update_no_force"
+                    ):
+                        # Force failure to trigger special notification via failure handler
+                        raise Exception(
+                            "Force update requested but update method is 'update_no_force'"
+                        )
+
+                    # Set up temporary workspace with configuration files
+                    system_utils.copy_configs_to_temp_dir(cdb, temp_dir)
                 
-                # Execute FanFicFare download/update command
-                output = execute_command(command)
+                    # Execute FanFicFare download/update command
+                    output = execute_command(command)
                 
-            except Exception as e:
-                # Log execution failure and route to failure handler
-                ff_logging.log_failure(
-                    f"\t({site}) Failed to update {path_or_url}: {e}"
+                except Exception as e:
+                    # Log execution failure and route to failure handler
+                    ff_logging.log_failure(
+                        f"\t({site}) Failed to update {path_or_url}: {e}"
+                    )
+                    handle_failure(fanfic, notification_info, waiting_queue, cdb)
+                    continue
+
+                # Parse FanFicFare output for permanent failure conditions
+                if not regex_parsing.check_failure_regexes(output):
+                    handle_failure(fanfic, notification_info, waiting_queue, cdb)
+                    continue
+
+                # Check for conditions that can be resolved with force retry
+                if regex_parsing.check_forceable_regexes(output):
+                    # Set force behavior and re-queue for immediate retry
+                    fanfic.behavior = "force"
+                    queue.put(fanfic)
+                    continue
+
+                # Process successful download - integrate with Calibre library
+                process_fanfic_addition(
+                    fanfic,
+                    cdb,
+                    temp_dir,
+                    site,
+                    path_or_url,
+                    waiting_queue,
+                    notification_info,
                 )
-                handle_failure(fanfic, notification_info, waiting_queue, cdb)
-                continue
-
-            # Parse FanFicFare output for permanent failure conditions
-            if not regex_parsing.check_failure_regexes(output):
-                handle_failure(fanfic, notification_info, waiting_queue, cdb)
-                continue
-
-            # Check for conditions that can be resolved with force retry
-            if regex_parsing.check_forceable_regexes(output):
-                # Set force behavior and re-queue for immediate retry
-                fanfic.behavior = "force"
-                queue.put(fanfic)
-                continue
-
-            # Process successful download - integrate with Calibre library
-            process_fanfic_addition(
-                fanfic,
-                cdb,
-                temp_dir,
-                site,
-                path_or_url,
-                waiting_queue,
-                notification_info,
-            )
+        except Exception:
+            # Hand the rest of the batch back so a crash only loses this story
+            if pending:
+                queue.put(pending)
+            raise
@@ -566,14 +566,13 @@ class TestFanficdownloadIntegration(unittest.TestCase):
             self.assertTrue(result)
 
     # Full Application Integration Test
-    @patch("fanficdownload.url_ingester.EmailInfo")
     @patch("fanficdownload.notification_wrapper.NotificationWrapper")
     @patch("fanficdownload.calibre_info.CalibreInfo")
     @patch("fanficdownload.regex_parsing.url_parsers", {"test_site": MagicMock()})
     @patch("fanficdownload.parse_arguments")
     @patch("fanficdownload.ff_logging")
     def test_full_application_integration(
-        self, mock_logging, mock_args, mock_calibre, mock_notification, mock_email
+        self, mock_logging, mock_args, mock_calibre, mock_notification
     ):
         """Test full application startup and shutdown."""
         # Write test configuration
@@ -585,7 +584,6 @@ class TestFanficdownloadIntegration(unittest.TestCase):
         mock_args.return_value.verbose = False
 
         # Mock other components
-        mock_email.return_value = MagicMock()
         mock_notification.return_value = MagicMock()
         mock_calibre_instance = MagicMock()
         mock_calibre_instance.check_installed.return_value = None
@@ -595,7 +593,7 @@ class TestFanficdownloadIntegration(unittest.TestCase):
         def mock_worker(*args):
             time.sleep(0.05)  # Brief simulation
 
-        with patch("fanficdownload.url_ingester.email_watcher", mock_worker):
+        with patch("fanficdownload.url_ingester.folder_watcher", mock_worker):
             with patch("fanficdownload.ff_waiter.wait_processor", mock_worker):
                 with patch("fanficdownload.url_worker.url_worker", mock_worker):
                     with patch(
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -36,6 +37,15 @@ class TestFanficInfo(unittest.TestCase):
         self.assertIsNone(fanfic_info_default.title)
         self.assertFalse(fanfic_info_default.hail_mary)
 
+    @parameterized.expand([("hail_mary_off", False), ("hail_mary_on", True)])
+    def test_pickle_round_trip(self, name, hail_mary):
+        self.fanfic_info.repeats = 3
+        self.fanfic_info.hail_mary = hail_mary
+
+        restored = pickle.loads(pickle.dumps(self.fanfic_info))
+
+        self.assertEqual(vars(restored), vars(self.fanfic_info))
+
     def test_increment_repeat(self):
         self.fanfic_info.increment_repeat()
         self.assertEqual(self.fanfic_info.repeats, 1)
@@ -46,6 +46,12 @@ def infinite_worker_function(stop_event=None):
         time.sleep(0.1)
 
 
+def sigterm_ignoring_worker_function(duration=30):
+    """Worker function that ignores SIGTERM, so only SIGKILL stops it."""
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    time.sleep(duration)
+
+
 class TestProcessInfo(unittest.TestCase):
     """Test ProcessInfo dataclass functionality."""
 
@@ -244,6 +250,50 @@ class TestProcessManager(unittest.TestCase):
         self.assertEqual(process_info.state, ProcessState.STOPPED)
         self.assertFalse(process_info.is_alive())
 
+    def test_stop_all_uses_stop_callback(self):
+        """Test shutdown lets a process with a stop callback exit on its own."""
+        stop_event = mp.Event()
+        self.manager.register_process(
+            "test", infinite_worker_function, (stop_event,), stop_callback=stop_event.set
+        )
+        self.manager.start_process("test")
+        process = self.manager.processes["test"].process
+
+        self.assertTrue(self.manager.stop_all(timeout=5.0))
+
+        self.assertTrue(stop_event.is_set())
+        # Exited normally rather than being terminated by SIGTERM
+        self.assertEqual(process.exitcode, 0)
+
+    def test_stop_callback_shares_shutdown_timeout(self):
+        """Test the stop callback and SIGTERM waits fit in one timeout."""
+        stop_callback = Mock()
+        self.manager.register_process(
+            "test", sigterm_ignoring_worker_function, stop_callback=stop_callback
+        )
+        self.manager.start_process("test")
+        time.sleep(0.2)  # Let the child install its SIGTERM handler
+
+        start = time.monotonic()
+        self.manager.stop_all(timeout=2.0)
+        elapsed = time.monotonic() - start
+
+        stop_callback.assert_called_once()
+        self.assertFalse(self.manager.processes["test"].is_alive())
+        # 2s graceful budget plus the brief SIGKILL join, not 2s per stage
+        self.assertLess(elapsed, 3.5)
+
+    def test_stop_process_skips_stop_callback_outside_shutdown(self):
+        """Test a plain stop (e.g. for a restart) does not call the stop callback."""
+        stop_callback = Mock()
+        self.manager.register_process(
+            "test", dummy_worker_function, (5.0,), stop_callback=stop_callback
+        )
+        self.manager.start_process("test")
+
+        self.assertTrue(self.manager.stop_process("test", timeout=1.0))
+        stop_callback.assert_not_called()
+
     def test_restart_process_success(self):
         """Test successful process restart."""
         self.manager.register_process("test", dummy_worker_function, (0.5,))
@@ -231,6 +231,24 @@ class TestRegexParsing(unittest.TestCase):
         self.assertEqual(fanfic.url, expected_url)
         self.assertEqual(fanfic.site, expected_site)
 
+    @parameterized.expand(
+        [
+            ("no_www", r"https?://(archiveofourown\.org/works/\d+)/?.*", "archiveofourown.org"),
+            ("optional_www", r"https?://(?:www\.)?royalroad\.com(/fiction/\d+)/?.*", "royalroad.com"),
+            ("forum", r"https?://forums\.spacebattles\.com(/threads/[^/]*\.\d+)/?.*", "forums.spacebattles.com"),
+            ("hyphenated", r"https?://(dark\-solace\.org/elysian/viewstory\.php)/?.*", "dark-solace.org"),
+            ("catch_all", r"https?://(.*)", None),
+        ]
+    )
+    def test_literal_domain(self, name, pattern, expected):
+        self.assertEqual(regex_parsing._literal_domain(pattern), expected)
+
+    def test_site_table_preserves_parser_order(self):
+        self.assertEqual(
+            [site for site, _, _, _ in regex_parsing._site_table],
+            list(regex_parsing.url_parsers),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
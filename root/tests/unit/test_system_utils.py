@@ -1,11 +1,13 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, mock_open
 from parameterized import parameterized
 
 from system_utils import (
     temporary_directory,
     get_files,
     copy_configs_to_temp_dir,
+    get_filesystem_type,
+    is_network_filesystem,
 )
 import os
 from typing import NamedTuple, Optional
@@ -131,5 +133,33 @@ class TestSystemUtils(unittest.TestCase):
         self.assertEqual(mock_copyfile.call_count, len(expected_calls))
 
 
+    MOUNTS = (
+        "/dev/sda1 / ext4 rw,relatime 0 0\n"
+        "proc /proc proc rw,nosuid 0 0\n"
+        "//nas/share /watch cifs rw,vers=3.0 0 0\n"
+        "nas:/export /mnt/my\\040books nfs4 rw 0 0\n"
+    )
+
+    @parameterized.expand(
+        [
+            ("root_fs", "/home/user/urls", "ext4", False),
+            ("cifs_mount_point", "/watch", "cifs", True),
+            ("cifs_subdirectory", "/watch/inbox", "cifs", True),
+            ("prefix_is_not_mount", "/watchlist", "ext4", False),
+            ("escaped_space", "/mnt/my books/urls", "nfs4", True),
+        ]
+    )
+    @patch("os.path.realpath", side_effect=lambda p: p)
+    def test_get_filesystem_type(self, name, path, expected_type, expected_network, _):
+        with patch("builtins.open", mock_open(read_data=self.MOUNTS)):
+            self.assertEqual(get_filesystem_type(path), expected_type)
+            self.assertEqual(is_network_filesystem(path), expected_network)
+
+    @patch("builtins.open", side_effect=FileNotFoundError)
+    def test_get_filesystem_type_without_mount_table(self, _):
+        self.assertIsNone(get_filesystem_type("/watch"))
+        self.assertFalse(is_network_filesystem("/watch"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,18 +1,22 @@
 from parameterized import parameterized
 import unittest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock
 import multiprocessing as mp
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-from url_ingester import FolderWatcherInfo, folder_watcher, EmailInfo, email_watcher
+from url_ingester import FolderWatcherInfo, folder_watcher
+import url_ingester
 from notification_wrapper import NotificationWrapper
 from fanfic_info import FanficInfo
 from config_models import (
     AppConfig,
     FolderWatcherConfig,
     SMTPConfig,
-    EmailConfig,
     CalibreConfig,
     AppriseConfig,
     PushbulletConfig,
@@ -20,6 +24,11 @@ from config_models import (
 
 
 class TestUrlIngester(unittest.TestCase):
+    def setUp(self):
+        # Parsed URLs are memoized at module level; start every test cold
+        url_ingester._parse_url.cache_clear()
+        url_ingester._load_config_cached.cache_clear()
+
     @parameterized.expand(
         [
             (
@@ -43,9 +52,10 @@ class TestUrlIngester(unittest.TestCase):
         ]
     )
     @patch("config_models.ConfigManager.load_config")
-    @patch("pathlib.Path.mkdir")
+    @patch("os.makedirs")
+    @patch("os.path.isdir", return_value=False)
     def test_folder_watcher_info_init_basic(
-        self, name, folder_path, sleep_time, ffnet_disable, mock_mkdir, mock_load_config
+        self, name, folder_path, sleep_time, ffnet_disable, mock_isdir, mock_makedirs, mock_load_config
     ):
         # Setup mock config
         mock_config = AppConfig(
@@ -66,193 +76,355 @@ class TestUrlIngester(unittest.TestCase):
         self.assertEqual(folder_info.folder_path, folder_path)
         self.assertEqual(folder_info.sleep_time, sleep_time)
         self.assertEqual(folder_info.ffnet_disable, ffnet_disable)
-        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+        mock_isdir.assert_called_once_with(folder_path)
+        mock_makedirs.assert_called_once_with(folder_path, exist_ok=True)
+
+    @patch("config_models.ConfigManager.load_config")
+    @patch("os.makedirs")
+    @patch("os.path.isdir", return_value=True)
+    def test_folder_watcher_info_init_existing_folder(
+        self, mock_isdir, mock_makedirs, mock_load_config
+    ):
+        mock_load_config.return_value = AppConfig(
+            folder_watcher=FolderWatcherConfig(folder_path="/tmp/url_folder"),
+            calibre=CalibreConfig(path="/tmp/calibre"),
+        )
+
+        FolderWatcherInfo("test_path.toml")
+
+        mock_makedirs.assert_not_called()
 
     @parameterized.expand(
         [
-            (
-                "basic_config",
-                "testuser",
-                "test_password",
-                "test_server",
-                "test_mailbox",
-                10,
-            ),
-            (
-                "different_config",
-                "anotheruser",
-                "another_password",
-                "another_server",
-                "another_mailbox",
-                20,
-            ),
-            (
-                "minimal_config",
-                "minimaluser",
-                "min_pass",
-                "min_server",
-                "INBOX",
-                5,
-            ),
+            ("scenario_1", ["https://archiveofourown.org/works/123", "https://fanfiction.net/s/456"]),
+            ("scenario_2", ["https://example.com/story/789"]),
+            ("empty_folder", []),
         ]
     )
     @patch("config_models.ConfigManager.load_config")
-    def test_email_info_init_basic(
-        self, name, email, password, server, mailbox, sleep_time, mock_load_config
-    ):
-        # Setup mock config
-        mock_config = AppConfig(
-            folder_watcher=FolderWatcherConfig(folder_path="/tmp/folder"),
-            email=EmailConfig(
-                email=email,
-                password=password,
-                server=server,
-                mailbox=mailbox,
-                sleep_time=sleep_time,
-            ),
-            calibre=CalibreConfig(path="/tmp/calibre"),
-            smtp=SMTPConfig(),
-            apprise=AppriseConfig(),
-            pushbullet=PushbulletConfig(),
+    def test_folder_watcher_get_urls(self, name, expected_urls, mock_load_config):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Setup mock config
+            mock_config = AppConfig(
+                folder_watcher=FolderWatcherConfig(
+                    folder_path=temp_dir,
+                    sleep_time=60,
+                    ffnet_disable=False,
+                ),
+                calibre=CalibreConfig(path="/tmp/calibre"),
+                smtp=SMTPConfig(),
+                apprise=AppriseConfig(),
+                pushbullet=PushbulletConfig(),
+            )
+            mock_load_config.return_value = mock_config
+
+            # Create one file per URL plus files that must be left alone
+            for i, url in enumerate(expected_urls):
+                (Path(temp_dir) / f"test{i}.url").write_text(url, encoding="utf-8")
+            (Path(temp_dir) / "notes.txt").write_text("not a url file")
+            (Path(temp_dir) / "nested.url").mkdir()
+
+            folder_info = FolderWatcherInfo("test_path.toml")
+            urls = folder_info.get_urls()
+
+            self.assertEqual(len(urls), len(expected_urls))
+            for url in expected_urls:
+                self.assertIn(url, urls)
+
+            # Verify processed files were removed and everything else kept
+            self.assertEqual(
+                sorted(os.listdir(temp_dir)), ["nested.url", "notes.txt"]
+            )
+
+    @patch("config_models.ConfigManager.load_config")
+    def test_load_config_cached_until_file_changes(self, mock_load_config):
+        mock_load_config.side_effect = lambda path: object()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, "config.toml")
+            Path(config_path).write_text("[folder_watcher]\n")
+
+            first = url_ingester.load_config(config_path)
+            self.assertIs(url_ingester.load_config(config_path), first)
+            self.assertEqual(mock_load_config.call_count, 1)
+
+            # Rewriting the file invalidates the cached result
+            Path(config_path).write_text("[folder_watcher]\nsleep_time = 30\n")
+            self.assertIsNot(url_ingester.load_config(config_path), first)
+            self.assertEqual(mock_load_config.call_count, 2)
+
+    @patch("url_ingester.regex_parsing.generate_FanficInfo_from_url")
+    def test_parse_url_is_memoized(self, mock_generate):
+        url = "https://archiveofourown.org/works/123/chapters/4"
+        mock_generate.return_value = FanficInfo(
+            "https://archiveofourown.org/works/123", "archiveofourown"
         )
-        mock_load_config.return_value = mock_config
 
-        email_info = EmailInfo("test_path.toml")
+        for _ in range(3):
+            self.assertEqual(
+                url_ingester._parse_url(url),
+                ("https://archiveofourown.org/works/123", "archiveofourown"),
+            )
+
+        mock_generate.assert_called_once_with(url)
 
-        self.assertEqual(email_info.email, email)
-        self.assertEqual(email_info.password, password)
-        self.assertEqual(email_info.server, server)
-        self.assertEqual(email_info.mailbox, mailbox)
-        self.assertEqual(email_info.sleep_time, sleep_time)
+    def test_flush_uses_native_put_many(self):
+        batch = [FanficInfo(f"https://example.com/{i}", "a") for i in range(3)]
+        native_queue = MagicMock(spec=["put", "put_many"])
+        plain_queue = MagicMock(spec=["put"])
+
+        url_ingester._flush({"a": batch, "b": batch}, {"a": native_queue, "b": plain_queue})
+
+        native_queue.put_many.assert_called_once_with(batch)
+        native_queue.put.assert_not_called()
+        plain_queue.put.assert_called_once_with(batch)
 
     @parameterized.expand(
         [
-            ("ffnet_enabled", True),
-            ("ffnet_disabled", False),
+            ("with_url", b"https://archiveofourown.org/works/123\n", "https://archiveofourown.org/works/123"),
+            ("crlf_line", b"https://archiveofourown.org/works/123\r\n", "https://archiveofourown.org/works/123"),
+            ("invalid_utf8", b"https://example.com/caf\xe9", "https://example.com/caf\ufffd"),
         ]
     )
     @patch("config_models.ConfigManager.load_config")
-    def test_email_info_init_ffnet_disable(self, name, ffnet_disable, mock_load_config):
-        # Setup mock config with ffnet_disable setting
-        mock_config = AppConfig(
-            folder_watcher=FolderWatcherConfig(folder_path="/tmp/folder"),
-            email=EmailConfig(
-                email="testuser",
-                password="test_password",
-                server="test_server",
-                ffnet_disable=ffnet_disable,
-            ),
-            calibre=CalibreConfig(path="/tmp/calibre"),
-            smtp=SMTPConfig(),
-            apprise=AppriseConfig(),
-            pushbullet=PushbulletConfig(),
-        )
-        mock_load_config.return_value = mock_config
+    def test_folder_watcher_process_files(self, name, content, expected, mock_load_config):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mock_load_config.return_value = AppConfig(
+                folder_watcher=FolderWatcherConfig(folder_path=temp_dir),
+                calibre=CalibreConfig(path="/tmp/calibre"),
+                smtp=SMTPConfig(),
+                apprise=AppriseConfig(),
+                pushbullet=PushbulletConfig(),
+            )
+            url_file = Path(temp_dir) / "story.url"
+            url_file.write_bytes(content)
+
+            folder_info = FolderWatcherInfo("test_path.toml")
 
-        email_info = EmailInfo("test_path.toml")
+            self.assertEqual(folder_info._process_files([str(url_file)]), [expected])
+            self.assertFalse(url_file.exists())
+            # A second pass over the same (already removed) file reports nothing
+            self.assertEqual(folder_info._process_files([str(url_file)]), [])
+
+    @patch("config_models.ConfigManager.load_config")
+    def test_file_watch_loop_waits_for_empty_file(self, mock_load_config):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mock_load_config.return_value = AppConfig(
+                folder_watcher=FolderWatcherConfig(folder_path=temp_dir),
+                calibre=CalibreConfig(path="/tmp/calibre"),
+            )
+            url = "https://archiveofourown.org/works/123"
+            url_file = Path(temp_dir) / "story.url"
+            folder_info = FolderWatcherInfo("test_path.toml")
 
-        self.assertEqual(email_info.ffnet_disable, ffnet_disable)
+            def fake_watch(*args, **kwargs):
+                # The writer creates the file, then fills it in after the first event
+                url_file.touch()
+                yield {(url_ingester.watchfiles.Change.added, str(url_file))}
+                self.assertTrue(url_file.exists())
+                url_file.write_text(url, encoding="utf-8")
+                yield {(url_ingester.watchfiles.Change.modified, str(url_file))}
+
+            queues = {"other": MagicMock(spec=["put"])}
+            with patch("url_ingester.watchfiles.watch", fake_watch), patch(
+                "url_ingester._parse_url", return_value=(url, "other")
+            ):
+                url_ingester._file_watch_loop(folder_info, None, queues)
+
+            queues["other"].put.assert_called_once_with([FanficInfo(url, "other")])
+            self.assertFalse(url_file.exists())
 
     @parameterized.expand(
         [
-            ("scenario_1", ["https://archiveofourown.org/works/123", "https://fanfiction.net/s/456"]),
-            ("scenario_2", ["https://example.com/story/789"]),
-            ("empty_folder", []),
+            ("network_filesystem", True, True),
+            # None lets watchfiles apply WATCHFILES_FORCE_POLLING and WSL2 detection
+            ("local_filesystem", False, None),
         ]
     )
+    @patch("url_ingester.watchfiles.watch", return_value=iter(()))
+    def test_file_watch_loop_force_polling(
+        self, name, force_polling, expected, mock_watch
+    ):
+        folder_info = MagicMock(force_polling=force_polling, watch_interval=5)
+
+        url_ingester._file_watch_loop(folder_info, None, {})
+
+        self.assertIs(mock_watch.call_args.kwargs["force_polling"], expected)
+
     @patch("config_models.ConfigManager.load_config")
-    @patch("pathlib.Path.mkdir")
-    @patch("pathlib.Path.glob")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("pathlib.Path.unlink")
-    def test_folder_watcher_get_urls(
-        self, name, expected_urls, mock_unlink, mock_file_open, mock_glob, mock_mkdir, mock_load_config
+    def test_folder_watcher_process_files_race(self, mock_load_config):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mock_load_config.return_value = AppConfig(
+                folder_watcher=FolderWatcherConfig(folder_path=temp_dir),
+                calibre=CalibreConfig(path="/tmp/calibre"),
+            )
+            paths = [os.path.join(temp_dir, f"{name}.url") for name in "abc"]
+            for path in paths:
+                Path(path).write_text(f"https://example.com/{os.path.basename(path)}")
+            folder_info = FolderWatcherInfo("test_path.toml")
+            # A single worker keeps the unlink order deterministic
+            folder_info._pool = ThreadPoolExecutor(max_workers=1)
+
+            # Another consumer removes b.url between our read and unlink passes
+            real_unlink = os.unlink
+
+            def racing_unlink(path):
+                if path == paths[0]:
+                    real_unlink(paths[1])
+                real_unlink(path)
+
+            with patch("os.unlink", side_effect=racing_unlink):
+                urls = folder_info._process_files(paths)
+
+            self.assertEqual(urls, ["https://example.com/a.url", "https://example.com/c.url"])
+            self.assertEqual(os.listdir(temp_dir), [])
+            folder_info._pool.shutdown()
+
+    @parameterized.expand(
+        [
+            ("known_site", "archiveofourown", False, "archiveofourown"),
+            ("unknown_site", "unlisted", False, "other"),
+            ("ffnet_disabled", "fanfiction", True, None),
+            ("ffnet_enabled", "fanfiction", False, "other"),
+            ("ffnet_disabled_other_site", "archiveofourown", True, "archiveofourown"),
+        ]
+    )
+    @patch("url_ingester.regex_parsing.generate_FanficInfo_from_url")
+    def test_route_urls(self, name, site, ffnet_disable, expected_queue, mock_generate):
+        url = "https://example.com/story/1"
+        mock_generate.return_value = FanficInfo(url, site)
+        folder_info = MagicMock(ffnet_disable=ffnet_disable)
+        notification_info = MagicMock()
+        queues = {"archiveofourown": MagicMock(spec=["put"]), "other": MagicMock(spec=["put"])}
+
+        url_ingester._route_urls([url], folder_info, notification_info, queues)
+
+        for queue_name, queue in queues.items():
+            if queue_name == expected_queue:
+                queue.put.assert_called_once_with([FanficInfo(url, site)])
+            else:
+                queue.put.assert_not_called()
+        if expected_queue is None:
+            notification_info.send_notification.assert_called_once_with(
+                "New Fanfiction Download", url, site
+            )
+
+    @parameterized.expand(
+        [
+            ("ffnet_disabled", True, 0, 1),
+            ("ffnet_enabled", False, 1, 0),
+        ]
+    )
+    def test_route_urls_real_ffnet_url(
+        self, name, ffnet_disable, expected_puts, expected_notifications
     ):
-        # Setup mock config
-        mock_config = AppConfig(
-            folder_watcher=FolderWatcherConfig(
-                folder_path="/tmp/folder",
-                sleep_time=60,
-                ffnet_disable=False,
-            ),
-            calibre=CalibreConfig(path="/tmp/calibre"),
-            smtp=SMTPConfig(),
-            apprise=AppriseConfig(),
-            pushbullet=PushbulletConfig(),
+        # Run through the real site parsers rather than a mocked site id
+        url = "https://www.fanfiction.net/s/1234567/1/Story-Title"
+        folder_info = MagicMock(ffnet_disable=ffnet_disable)
+        notification_info = MagicMock()
+        queues = {"fanfiction": MagicMock(spec=["put"]), "other": MagicMock(spec=["put"])}
+
+        url_ingester._route_urls([url], folder_info, notification_info, queues)
+
+        self.assertEqual(queues["fanfiction"].put.call_count, expected_puts)
+        queues["other"].put.assert_not_called()
+        self.assertEqual(
+            notification_info.send_notification.call_count, expected_notifications
         )
-        mock_load_config.return_value = mock_config
 
-        # Mock files and their content
-        mock_file_paths = []
-        file_contents = {}
-        for i, url in enumerate(expected_urls):
-            file_path = f"/tmp/folder/test{i}.url"
-            mock_file_paths.append(Path(file_path))
-            file_contents[file_path] = url
-
-        # Mock the glob method to return our mock file paths
-        mock_glob.return_value = mock_file_paths
-        
-        # Set up mock_file_open to return the right content for each file
-        def side_effect(file_path, *args, **kwargs):
-            file_path_str = str(file_path)
-            if file_path_str in file_contents:
-                return mock_open(read_data=file_contents[file_path_str]).return_value
-            return mock_open(read_data="").return_value
-
-        mock_file_open.side_effect = side_effect
+    @parameterized.expand(
+        [
+            # Parsing alone gains nothing from threads and stays inline
+            ("ffnet_enabled", False, False),
+            # Notifications may block, so the batch is spread over the pool
+            ("ffnet_disabled", True, True),
+        ]
+    )
+    @patch("url_ingester.BATCH_SIZE", 2)
+    @patch("url_ingester.regex_parsing.generate_FanficInfo_from_url")
+    def test_route_urls_batches_by_site(self, name, ffnet_disable, uses_pool, mock_generate):
+        urls = [f"https://example.com/{site}/{i}" for site in ("a", "b") for i in range(3)]
+        mock_generate.side_effect = lambda url: FanficInfo(url, url.split("/")[3])
+        queues = {"a": MagicMock(spec=["put"]), "other": MagicMock(spec=["put"])}
+        folder_info = MagicMock(ffnet_disable=ffnet_disable)
+        folder_info._get_pool.return_value = ThreadPoolExecutor(max_workers=2)
 
-        folder_info = FolderWatcherInfo("test_path.toml")
-        urls = folder_info.get_urls()
+        url_ingester._route_urls(urls, folder_info, MagicMock(), queues)
+        folder_info._get_pool.return_value.shutdown()
 
-        self.assertEqual(len(urls), len(expected_urls))
-        for url in expected_urls:
-            self.assertIn(url, urls)
+        self.assertEqual(folder_info._get_pool.called, uses_pool)
 
-        # Verify files were unlinked
-        self.assertEqual(mock_unlink.call_count, len(expected_urls))
+        # Site "a" gets its three URLs as batches of at most BATCH_SIZE
+        self.assertEqual(
+            [c.args[0] for c in queues["a"].put.call_args_list],
+            [[FanficInfo(u, "a") for u in urls[0:2]], [FanficInfo(urls[2], "a")]],
+        )
+        # Unknown site "b" falls back to the "other" queue
+        self.assertEqual(
+            [c.args[0] for c in queues["other"].put.call_args_list],
+            [[FanficInfo(u, "b") for u in urls[3:5]], [FanficInfo(urls[5], "b")]],
+        )
 
     @parameterized.expand(
         [
-            ("scenario_1", ["url1", "url2"]),
-            ("scenario_2", ["url3", "url4", "url5"]),
-            ("empty_urls", []),
+            ("watcher_failed", True, [20, 40, 80, 160, 160, 160, 10, 20]),
+            # The sweep backs up a running watcher, so its interval stays fixed
+            ("watcher_running", False, [10] * 8),
         ]
     )
-    @patch("url_ingester.geturls.get_urls_from_imap")
-    @patch("config_models.ConfigManager.load_config")
-    def test_email_info_get_urls(
-        self, name, expected_urls, mock_load_config, mock_get_urls_from_imap
-    ):
-        # Setup mock config (email tests need folder_watcher due to new config structure)
-        mock_config = AppConfig(
-            folder_watcher=FolderWatcherConfig(
-                folder_path="/tmp/test_folder",
-                sleep_time=60,
-                ffnet_disable=False,
-            ),
-            email=EmailConfig(
-                email="testuser",
-                password="test_password",
-                server="test_server",
-                mailbox="test_mailbox",
-                sleep_time=10,
-            ),
-            calibre=CalibreConfig(path="/tmp/calibre"),
-            smtp=SMTPConfig(),
-            apprise=AppriseConfig(),
-            pushbullet=PushbulletConfig(),
+    @patch("url_ingester._route_urls")
+    def test_housekeeping_backoff(self, name, failed, expected_waits, mock_route_urls):
+        folder_info = MagicMock(sleep_time=10)
+        folder_info.get_urls.side_effect = [[], [], [], [], [], [], ["https://a"], []]
+        # Stop after the last sweep
+        folder_info.stop_event.wait.side_effect = [False] * 7 + [True]
+        watcher_failed = threading.Event()
+        if failed:
+            watcher_failed.set()
+
+        url_ingester._housekeeping_loop(folder_info, None, {}, watcher_failed)
+
+        self.assertEqual(
+            [c.args[0] for c in folder_info.stop_event.wait.call_args_list],
+            expected_waits,
         )
-        mock_load_config.return_value = mock_config
 
-        # Setup mock URL return
-        mock_get_urls_from_imap.return_value = expected_urls
+    @patch("url_ingester._file_watch_loop", side_effect=RuntimeError("inotify limit"))
+    @patch("url_ingester._housekeeping_loop")
+    def test_folder_watcher_flags_failed_watcher(self, mock_housekeeping, mock_watch_loop):
+        folder_info = MagicMock(sleep_time=60, force_polling=False, ffnet_disable=False)
+
+        folder_watcher(folder_info, None, {})
+
+        # The housekeeping sweep is told to take over as the backing-off poller
+        watcher_failed = mock_housekeeping.call_args.args[3]
+        self.assertTrue(watcher_failed.is_set())
+
+    @patch("config_models.ConfigManager.load_config")
+    def test_folder_watcher_stops_on_shutdown(self, mock_load_config):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mock_load_config.return_value = AppConfig(
+                folder_watcher=FolderWatcherConfig(folder_path=temp_dir, sleep_time=3600),
+                calibre=CalibreConfig(path="/tmp/calibre"),
+                smtp=SMTPConfig(),
+                apprise=AppriseConfig(),
+                pushbullet=PushbulletConfig(),
+            )
+            url = "https://archiveofourown.org/works/123"
+            (Path(temp_dir) / "story.url").write_text(url, encoding="utf-8")
+            queues = {"other": MagicMock(spec=["put"])}
+
+            folder_info = FolderWatcherInfo("test_path.toml")
+            folder_info.shutdown()
 
-        email_info = EmailInfo("test_path.toml")
-        result = email_info.get_urls()
+            # Returns after the initial sweep instead of sleeping for sleep_time
+            with patch("url_ingester._parse_url", return_value=(url, "other")), patch(
+                "url_ingester.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+            ) as mock_executor:
+                folder_watcher(folder_info, None, queues)
 
-        self.assertEqual(result, expected_urls)
-        mock_get_urls_from_imap.assert_called_once()
+            queues["other"].put.assert_called_once_with([FanficInfo(url, "other")])
+            # One pool, created up front and shared by both loops
+            mock_executor.assert_called_once()
 
 
 if __name__ == "__main__":
@@ -492,5 +492,54 @@ class TestUrlWorker(unittest.TestCase):
                 mock_notification_info.send_notification.assert_not_called()
 
 
+    class _StopWorker(Exception):
+        """Raised by the mocked queue to end url_worker's infinite loop."""
+
+    def _run_worker_batch(self, batch, get_path_or_url_side_effect):
+        queue = MagicMock()
+        # One batch to process, then stop the loop on the next empty() check
+        queue.empty.side_effect = [False, self._StopWorker()]
+        queue.get.return_value = list(batch)
+        cdb = MagicMock(spec=CalibreInfo)
+        cdb.update_method = "update"
+
+        with patch("url_worker.get_path_or_url", side_effect=get_path_or_url_side_effect), \
+            patch("url_worker.construct_fanficfare_command", return_value="cmd"), \
+            patch("url_worker.execute_command", return_value="output"), \
+            patch("url_worker.system_utils.copy_configs_to_temp_dir"), \
+            patch("url_worker.regex_parsing.check_failure_regexes", return_value=True), \
+            patch("url_worker.regex_parsing.check_forceable_regexes", return_value=False), \
+            patch("url_worker.process_fanfic_addition") as mock_addition, \
+            patch("url_worker.ff_logging.log"):
+            with self.assertRaises(Exception) as raised:
+                url_worker.url_worker(queue, cdb, MagicMock(), MagicMock())
+
+        return queue, mock_addition, raised.exception
+
+    def test_url_worker_processes_each_batch_entry(self):
+        batch = [FanficInfo(f"https://example.com/{i}", "other") for i in range(3)]
+
+        queue, mock_addition, error = self._run_worker_batch(
+            batch, lambda fanfic, cdb, temp_dir: fanfic.url
+        )
+
+        self.assertIsInstance(error, self._StopWorker)
+        queue.get.assert_called_once()
+        self.assertEqual([c.args[0] for c in mock_addition.call_args_list], batch)
+        queue.put.assert_not_called()
+
+    def test_url_worker_requeues_rest_of_batch_on_error(self):
+        batch = [FanficInfo(f"https://example.com/{i}", "other") for i in range(3)]
+
+        queue, mock_addition, error = self._run_worker_batch(
+            batch, ["https://example.com/0", RuntimeError("calibre unavailable")]
+        )
+
+        self.assertIsInstance(error, RuntimeError)
+        self.assertEqual(mock_addition.call_args.args[0], batch[0])
+        # The failing story is lost, the untouched one goes back on the queue
+        queue.put.assert_called_once_with([batch[2]])
+
+
 if __name__ == "__main__":
     unittest.main()